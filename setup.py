@@ -13,7 +13,7 @@ setup(
     ],
     packages=('randomtools',),
     package_dir={'': 'src'},
-    install_requires=['docopt', 'thefuzz', 'requests', ],
+    install_requires=['docopt', 'rapidfuzz', 'requests', ],
     python_requires='>=3',
     entry_points={
         'console_scripts': [
@@ -21,7 +21,36 @@ import json
 
 import csv
 
-from collections import OrderedDict
+import re
+
+needs_quoting_regexp = re.compile(r'[,"\r\n]')
+
+
+def csv_field(value):
+    if value is None:
+        return ''
+
+    return str(value)
+
+
+def write_map_rows(output_csv, writer, items):
+    line_format = '{},{}' + writer.dialect.lineterminator
+
+    lines = []
+
+    for key, value in items:
+        key, value = csv_field(key), csv_field(value)
+
+        if needs_quoting_regexp.search(key) or needs_quoting_regexp.search(value):
+            output_csv.write(''.join(lines))
+            lines = []
+
+            writer.writerow([key, value])
+        else:
+            lines.append(line_format.format(key, value))
+
+    output_csv.write(''.join(lines))
+
 
 def main():
     arguments = docopt(__doc__, version='1.0')
@@ -31,9 +60,9 @@ def main():
 
     map_dict = {}
     with open(str(map_path)) as map_file:
-        map_dict = json.load(map_file, object_pairs_hook=OrderedDict)
+        map_dict = json.load(map_file)
 
-    with open(str(out_file), 'w') as output_csv:
+    with open(str(out_file), 'w', newline='', buffering=1 << 20) as output_csv:
         writer = csv.writer(output_csv)
 
         if arguments['-k'] or arguments['-v']:
@@ -44,8 +73,7 @@ def main():
 
             writer.writerow(title_row)
 
-        for key, value in map_dict.items():
-            writer.writerow([key, value])
+        write_map_rows(output_csv, writer, map_dict.items())
             
         
 
@@ -5,22 +5,36 @@ Usage:
     movetoguids [options] IN_DIRECTORY OUT_DIRECTORY
 
 Options:
-    -p MAP      Persist files in a JSON map.
-    -h, --help  Show this message.
-    --version   Show version information.
+    -p MAP             Persist files in a JSON map.
+    -d, --deduplicate  Reuse one output file for inputs with identical content
+                       and extension.
+    -h, --help         Show this message.
+    --version          Show version information.
 """
 
 from pathlib import Path
 
 from docopt import docopt
 
-from shutil import copy
+from shutil import copyfile
 
 import os
 
 import json
+import hashlib
 from uuid import uuid4
 
+
+def content_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+
+    with open(str(path), 'rb') as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
 def main():
     arguments = docopt(__doc__, version='1.0')
 
@@ -34,21 +48,53 @@ def main():
             with open(map_path) as map_file:
                 guid_dict = json.load(map_file)
 
-    for path in in_directory.iterdir():
-        if path.name not in guid_dict:
-            guid_dict[path.name] = "{}{}".format(
-                str(uuid4()),
-                path.suffix
+    existing = set(os.listdir(out_directory))
+
+    with os.scandir(in_directory) as it:
+        entries = list(it)
+
+    content_keys = {}
+
+    if arguments['--deduplicate']:
+        for entry in entries:
+            content_keys[entry.name] = (
+                content_digest(entry.path),
+                os.path.splitext(entry.name)[1]
             )
-        
-        out_file = out_directory / guid_dict[path.name]
 
-        if not out_file.exists():
+    content_dict = {
+        content_key: guid_dict[name]
+        for name, content_key in content_keys.items()
+        if name in guid_dict
+    }
+
+    for entry in entries:
+        content_key = content_keys.get(entry.name)
+
+        if entry.name not in guid_dict:
+            if content_key in content_dict:
+                guid_dict[entry.name] = content_dict[content_key]
+            else:
+                guid_dict[entry.name] = "{}{}".format(
+                    str(uuid4()),
+                    os.path.splitext(entry.name)[1]
+                )
+
+        guid = guid_dict[entry.name]
+
+        if content_key:
+            content_dict.setdefault(content_key, guid)
+
+        if guid not in existing:
+            out_file = out_directory / guid
+
             print("Copy {} to {}".format(
-                str(path), str(out_file)
+                entry.path, str(out_file)
             ))
 
-            copy(str(path), str(out_file))
+            copyfile(entry.path, str(out_file))
+
+            existing.add(guid)
     
     if map_path := arguments['-p']:
         with open(map_path, 'w') as map_file:
@@ -16,9 +16,26 @@ from docopt import docopt
 
 import os
 
-IGNORED_ITEMS = [
+from fnmatch import fnmatch
+
+IGNORED_ITEMS = {
     'README.md',
-]
+}
+
+
+def matching_items(path, pattern):
+    if '/' in pattern or os.sep in pattern or '**' in pattern:
+        return [
+            (item.name, str(item)) for item in sorted(path.glob(pattern))
+        ]
+
+    with os.scandir(path) as entries:
+        names = sorted(
+            entry.name for entry in entries if fnmatch(entry.name, pattern)
+        )
+
+    return [(name, str(path / name)) for name in names]
+
 
 def main():
     arguments = docopt(__doc__, version='1.0.1')
@@ -28,8 +45,8 @@ def main():
 
     rel = path.relative_to(cwd)
 
-    for item in sorted(rel.glob(arguments['--pattern'])):
-        if item.name in IGNORED_ITEMS:
+    for name, item in matching_items(rel, arguments['--pattern']):
+        if name in IGNORED_ITEMS:
             continue
 
-        print("- [{}]({})".format(str(item.name), str(item)))
\ No newline at end of file
+        print("- [{}]({})".format(name, item))
\ No newline at end of file
@@ -20,25 +20,45 @@ from docopt import docopt
 from shutil import copy
 
 import os
+import sys
 import csv
 
 import json
 
 import re
 
-from thefuzz import process
+import tempfile
 
 number_regexp = re.compile(r'^(0|1|2|3|4)$') 
 
 
 pattern = "https://sodaconf2021.makimo.pl/{file}"
 
+PERSIST_EVERY = 25
+
 def remvovefilesuffix(name):
     return '.'.join(name.split('.')[:-1])
 
+def persist_link_map(map_path, link_map):
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(map_path)),
+        suffix='.tmp'
+    )
+
+    try:
+        with os.fdopen(fd, 'w') as map_file:
+            json.dump(link_map, map_file)
+
+        os.replace(temp_path, map_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
 def main():
     arguments = docopt(__doc__, version='1.0')
 
+    from rapidfuzz import fuzz, process, utils
+
     in_csv_path = Path(arguments['IN_CSVFILE']).resolve(strict=True)
     map_path = Path(arguments['MAPFILE']).resolve(strict=True)
 
@@ -46,11 +66,12 @@ def main():
         guid_dict = json.load(map_file)
     
     choice_dict = {remvovefilesuffix(k): v for k,v in guid_dict.items()}
-    choices = choice_dict.keys()
+    choices = list(choice_dict.keys())
+    processed_choices = [utils.default_process(choice) for choice in choices]
 
     column_number = int(arguments['--column'])
 
-    print(choices)
+    print(choice_dict.keys())
 
     new_rows = []
 
@@ -61,7 +82,7 @@ def main():
             with open(map_path) as map_file:
                 link_map = json.load(map_file)
 
-    with open(str(in_csv_path)) as input_csv:
+    with open(str(in_csv_path), newline='') as input_csv:
         reader = csv.reader(input_csv)
 
         first_row = True
@@ -79,10 +100,20 @@ def main():
 
                 print(row)
 
-                tuples = process.extract(email, choices, limit=5)
-
-                for i, item in enumerate(tuples):
-                    print("{}) {} ({}%)".format(i, item[0], item[1]))
+                tuples = [
+                    (choices[index], score) for _, score, index in process.extract(
+                        utils.default_process(email),
+                        processed_choices,
+                        scorer=fuzz.WRatio,
+                        processor=None,
+                        limit=5
+                    )
+                ]
+
+                sys.stdout.write(''.join(
+                    "{}) {} ({}%)\n".format(i, item[0], round(item[1]))
+                    for i, item in enumerate(tuples)
+                ))
 
                 text = input("Choice [number/filename/Default/Skip/Continue]: ").strip()
                 
@@ -101,9 +132,14 @@ def main():
                     link = pattern.format(file=link)
 
                 link_map[email] = link
+
+                if arguments['-p'] and len(link_map) % PERSIST_EVERY == 0:
+                    try:
+                        persist_link_map(arguments['-p'], link_map)
+                    except OSError as e:
+                        print("Could not save {}: {}".format(arguments['-p'], e))
         except KeyboardInterrupt:
             pass
 
     if map_path := arguments['-p']:
-        with open(map_path, 'w') as map_file:
-            json.dump(link_map, map_file)
\ No newline at end of file
+        persist_link_map(map_path, link_map)
\ No newline at end of file
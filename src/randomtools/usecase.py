@@ -50,11 +50,15 @@ class Scenario:
     cases: list[Case]
 
 
-re_version = re.compile(r'^#{1,3} \(v([\d\.\-\w]+)\)')
-re_cases = re.compile(r'^#{1,3} Cases')
-re_case = re.compile(r'^#{1,3} (\d+)\. (.+)$')
-
-re_case_simple = re.compile(r'^(\d+)\. (.+)$')
+re_line = re.compile(
+    r'^(?:'
+    r'#{1,3} \(v(?P<version>[\d\.\-\w]+)\)'
+    r'|#{1,3} (?P<cases>Cases)'
+    r'|#{1,3} (?P<case_number>\d+)\. (?P<case_name>.+)$'
+    r'|(?P<simple_number>\d+)\. (?P<simple_name>.+)$'
+    r'|(?P<header>#)'
+    r')'
+)
 
 
 def read_file(filename):
@@ -65,27 +69,33 @@ def read_file(filename):
     cases = []
 
     with open(filename, 'r') as f:
-        for line in f.readlines():
-            if m := re_version.match(line):
-                case_dict['version'] = m.group(1)
+        for line in f:
+            if line[:1] != '#' and not line[:1].isdigit():
+                continue
+
+            if not (m := re_line.match(line)):
+                continue
+
+            if m.group('version') is not None:
+                case_dict['version'] = m.group('version')
                 in_cases = True
-            elif m := re_cases.match(line):
+            elif m.group('cases') is not None:
                 in_cases = True
-            elif m := re_case.match(line):
-                if m.group(2).startswith('.'):
+            elif m.group('case_number') is not None:
+                if m.group('case_name').startswith('.'):
                     continue
 
-                case_dict['name'] = m.group(2)
-                case_dict['original_enumeration'] = m.group(1)
+                case_dict['name'] = m.group('case_name')
+                case_dict['original_enumeration'] = m.group('case_number')
                 cases.append(Case(**case_dict, simple=False))
-            elif in_cases and (m := re_case_simple.match(line)):
-                if m.group(2).startswith('.'):
+            elif m.group('simple_number') is not None:
+                if not in_cases or m.group('simple_name').startswith('.'):
                     continue
 
-                case_dict['name'] = m.group(2)
-                case_dict['original_enumeration'] = m.group(1)
+                case_dict['name'] = m.group('simple_name')
+                case_dict['original_enumeration'] = m.group('simple_number')
                 cases.append(Case(**case_dict, simple=True))
-            elif line.startswith('#'):
+            else:
                 in_cases = False
     
     if len(cases) == 0:
@@ -99,7 +109,7 @@ def default_scenario_name_func(scenario):
 
 
 def print_scenario(scenario, name_func=default_scenario_name_func):
-    print(name_func(scenario))
+    lines = [name_func(scenario)]
     
     for i, case in enumerate(scenario.cases, start=1):
         if case.version:
@@ -107,9 +117,11 @@ def print_scenario(scenario, name_func=default_scenario_name_func):
         else:
             version_string = ''
 
-        print('{}. {}{}'.format(i, case.name, version_string))
+        lines.append('{}. {}{}'.format(i, case.name, version_string))
     
-    print('')
+    lines.append('\n')
+
+    sys.stdout.write('\n'.join(lines))
 
 
 def print_scenarios(scenarios, **kwargs):
@@ -140,12 +152,6 @@ def main():
     else:
         paths = [filename]
 
-    scenarios = []
-
-    for path in paths:
-        if scenario := read_file(path):
-            scenarios.append(scenario)
-
     colon = not arguments['--no-colon']
 
     name_func = default_scenario_name_func
@@ -168,6 +174,6 @@ def main():
         name_func = decorate_with_colon(name_func)
 
     print_scenarios(
-        scenarios,
+        filter(None, map(read_file, paths)),
         name_func=name_func
     )
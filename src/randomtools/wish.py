@@ -11,6 +11,8 @@ Options:
 
 URL="https://cudowne.zyczenia.online/wishes/get?isPlural={is_plural}"
 
+TIMEOUT=5
+
 import json, os, re, sys
 
 from docopt import docopt
@@ -21,7 +23,17 @@ import tempfile
 
 import subprocess
 
-import requests
+
+def create_session():
+    import requests
+
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+    return session
 
 
 def main():
@@ -31,7 +43,8 @@ def main():
         is_plural='true' if arguments['--plural'] else 'false'
     )
 
-    r = requests.get(url)
+    with create_session() as session:
+        r = session.get(url, timeout=TIMEOUT)
 
     if r.ok:
         print(r.json()['content'])